@@ -2,14 +2,6 @@ import logging
 from collections.abc import Mapping
 from datetime import datetime, timedelta
 
-import jwt
-from jwt.exceptions import (
-    DecodeError,
-    ExpiredSignatureError,
-    InvalidKeyError,
-    InvalidSignatureError,
-    InvalidTokenError,
-    )
 from pyramid.exceptions import ConfigurationError
 from pyramid.settings import aslist
 from webob.multidict import MultiDict
@@ -130,6 +122,8 @@ class JWTSignedParamsService:
         valid tokens will be merged.
 
         """
+        jwt = _jwt()
+
         if hasattr(params, 'items'):
             params = params.items()
         params = [(str(key), str(value)) for key, value in params]
@@ -163,21 +157,26 @@ class JWTSignedParamsService:
         found in ``params``, or those with invalid signatures will be ignored.
 
         """
+        exceptions = _jwt().exceptions
         tokens = _getall(params, '_sp')
         data = []
         for token in tokens:
             try:
                 claims = self._verify(token)
-            except ExpiredSignatureError as ex:
+            except exceptions.ExpiredSignatureError as ex:
                 # FIXME: way to indicate that an expired token was encountered
                 log.info("Expired JWT token: %s", ex)
-            except (InvalidTokenError, InvalidKeyError, UnrecognizedKID) as ex:
+            except (exceptions.InvalidTokenError,
+                    exceptions.InvalidKeyError,
+                    UnrecognizedKID) as ex:
                 log.debug("Invalid JWT token: %s", ex)
             else:
                 data.extend(claims['_qs'])
         return MultiDict(data)
 
     def _verify(self, token):
+        jwt = _jwt()
+        exceptions = jwt.exceptions
         kid = jwt.get_unverified_header(token).get('kid')
         secrets = self.secret_provider.valid_secrets(kid)
         assert len(secrets) > 0
@@ -187,10 +186,10 @@ class JWTSignedParamsService:
             try:
                 return jwt.decode(token, secret,
                                   algorithms=self.accepted_algorithms)
-            except ExpiredSignatureError:
+            except exceptions.ExpiredSignatureError:
                 # Signature expired. No point trying other secrets.
                 raise
-            except InvalidSignatureError as exc:
+            except exceptions.InvalidSignatureError as exc:
                 # Note that with PyJWT < 1.6, this is actually a DecodeError.
                 # Note that if we encounter both DecodeErrors and
                 # InvalidKeyErrors, we'd rather report the
@@ -198,17 +197,24 @@ class JWTSignedParamsService:
                 if not have_invalid_signature_error:
                     saved_exc = exc
                     have_invalid_signature_error = True
-            except InvalidKeyError as exc:
+            except exceptions.InvalidKeyError as exc:
                 # InvalidKeyError is secret-specific as well.
                 if saved_exc is None:
                     saved_exc = exc
-            except (InvalidTokenError, DecodeError):
+            except (exceptions.InvalidTokenError, exceptions.DecodeError):
                 # Any other problems are presumably not going to get
                 # better retrying with another secret.  Quit now.
                 raise
         raise saved_exc
 
 
+def _jwt():
+    # Imported on first use: PyJWT and its crypto backend are slow to load.
+    import jwt
+    import jwt.exceptions
+    return jwt
+
+
 def _getall(params, name):
     if hasattr(params, 'getall'):
         return params.getall(name)
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+
+INCLUDE = '\n'.join([
+    'from pyramid.config import Configurator',
+    'settings = {"pyramid_signed_params.secret": "sekret"}',
+    'config = Configurator(settings=settings)',
+    'config.include("pyramid_signed_params")',
+    'config.commit()',
+    ])
+
+SIGN = '\n'.join([
+    INCLUDE,
+    'from pyramid.request import Request, apply_request_extensions',
+    'request = Request.blank("/")',
+    'request.registry = config.registry',
+    'apply_request_extensions(request)',
+    'request.sign_query({"foo": "bar"})',
+    ])
+
+
+def jwt_modules_loaded(code):
+    """Run ``code`` in a fresh interpreter.
+
+    Returns the names of any ``jwt`` modules which were imported.
+    (This checks which modules get loaded, it does not measure import time.)
+
+    """
+    code += '\n'.join([
+        '',
+        'import sys',
+        'print("\\n".join(m for m in sys.modules',
+        '                 if m == "jwt" or m.startswith("jwt.")))',
+        ])
+    proc = subprocess.run(
+        [sys.executable, '-c', code],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True)
+    return proc.stdout.split()
+
+
+@pytest.mark.parametrize('code', [
+    'import pyramid_signed_params',
+    'import pyramid_signed_params.jwt_signer',
+    INCLUDE,
+    ])
+def test_jwt_not_imported(code):
+    assert jwt_modules_loaded(code) == []
+
+
+def test_jwt_imported_on_first_use():
+    assert 'jwt' in jwt_modules_loaded(SIGN)